@@ -1,173 +1,408 @@
 import json
+import mmap
 import os
+import queue
+import shutil
+import tempfile
+import threading
 from PyQt5.QtWidgets import (QApplication, QCheckBox, QSlider, QWidget,
                              QVBoxLayout, QPushButton, QLabel, QFileDialog, QMessageBox, QSpinBox, QHBoxLayout)
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PIL import Image
 import multiprocessing
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 import sys
 
+# Optional: libjpeg-turbo decoding for JPEG inputs (pip install PyTurboJPEG)
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+except ImportError:
+    TurboJPEG = None
+
+# Optional: faster JSON parsing of ComfyUI workflows (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_turbo_jpeg = None
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tiff')
+
+
+def get_turbo_jpeg():
+    # Created lazily once per worker process, None when libturbojpeg is unavailable
+    global _turbo_jpeg
+    if _turbo_jpeg is None and TurboJPEG is not None:
+        try:
+            _turbo_jpeg = TurboJPEG()
+        except Exception:
+            _turbo_jpeg = False
+    return _turbo_jpeg or None
+
+
+def iter_image_files(folder):
+    # Recursive os.scandir walk, DirEntry caches the file type so no extra stat per entry
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_image_files(entry.path)
+                elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                    yield entry.path
+    except OSError:
+        # Skip unreadable directories, like os.walk does
+        return
+
+
+def json_loads(s):
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson is strict (e.g. NaN), let the stdlib parser have a go
+            pass
+    return json.loads(s)
+
+
+def prefetch_file(img_path):
+    # Read the whole file once so it is in the OS page cache before a worker maps it
+    with open(img_path, 'rb', buffering=0) as f:
+        while f.read(1 << 20):
+            pass
+
+
+def load_image(img_path):
+    # Decode from a read-only memory map so Pillow reads straight from the page cache
+    with open(img_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            mm = None
+        if mm is not None:
+            with mm:
+                try:
+                    img = Image.open(mm)
+                    # Pixels must be decoded before the map is closed
+                    img.load()
+                    return img
+                except ValueError:
+                    # e.g. 'seek out of range' for non-image data
+                    pass
+
+    # Open by path so Pillow raises its usual 'cannot identify image file' error
+    img = Image.open(img_path)
+    img.load()
+    return img
+
+
+def open_image(img_path):
+    # Decode JPEGs with libjpeg-turbo when available, everything else with Pillow
+    if img_path.lower().endswith(('.jpg', '.jpeg')):
+        tj = get_turbo_jpeg()
+        if tj is not None:
+            try:
+                with open(img_path, 'rb') as f:
+                    arr = tj.decode(f.read(), pixel_format=TJPF_RGB)
+                h, w = arr.shape[:2]
+                return Image.frombuffer('RGB', (w, h), arr, 'raw', 'RGB', 0, 1)
+            except Exception:
+                # e.g. CMYK or progressive edge cases, let Pillow handle them
+                pass
+    return load_image(img_path)
+
+
+def convert_single_image(img_path, output_path, quality, webp_method):
+    filename = os.path.basename(img_path)
+    try:
+        # Close the image as soon as it is saved instead of waiting for GC
+        with open_image(img_path) as img:
+            # Save the image as WebP. Pillow encodes WebP fully in memory and writes it
+            # with a single write() call, so a bigger file buffer wouldn't save syscalls;
+            # passing the path also lets Pillow remove the file if saving fails
+            img.save(output_path, 'webp', quality=quality, method=webp_method)
+        return output_path
+    except Exception as e:
+        raise Exception(f'Failed to convert {filename}: {e}')
+
+
+def convert_single_image_with_metadata(img_path, output_path, quality, webp_method):
+    filename = os.path.basename(img_path)
+    try:
+        # Only PNGs carry a workflow, reject anything else before decoding it
+        if not filename.lower().endswith(".png"):
+            raise Exception(f'Failed to convert {filename} with ComfyUI workflow.\n'
+                            f'Consider using png files with workflow or uncheck keep ComfyUI workflow')
+
+        # Close the image as soon as it is saved instead of waiting for GC
+        with load_image(img_path) as img:
+            # get info
+            try:
+                dict_of_info = img.info.copy()
+                # Remove nodes that may cause problems
+                try:
+                    workflow = dict_of_info.get("workflow")
+                    # Only parse when a LoraInfo node can be present or the string has
+                    # to be re-escaped, otherwise the original string is kept untouched
+                    if workflow and ('LoraInfo' in workflow or not workflow.isascii()):
+                        c = json_loads(workflow)
+                        nodes: list = c.get('nodes') or []
+                        kept = [n for n in nodes if n.get('type') != 'LoraInfo']
+                        if len(kept) != len(nodes):
+                            c['nodes'] = kept
+                        if len(kept) != len(nodes) or not workflow.isascii():
+                            # stdlib json escapes non-ASCII as \uXXXX, Pillow stores the EXIF
+                            # tag as ASCII and would turn raw non-ASCII characters into '?'
+                            dict_of_info['workflow'] = json.dumps(c)
+                except Exception as e:
+                    print(e)
+                    pass
+
+                # Saving
+                # ComfyUI PNGs normally carry no EXIF, only run Pillow's parser when they do
+                has_exif = "exif" in img.info or "Raw profile type exif" in img.info
+                img_exif = img.getexif() if has_exif else Image.Exif()
+                user_comment = dict_of_info.get("workflow", "")
+                img_exif[0x010e] = "Workflow:" + user_comment
+                # libwebp takes RGB/RGBA directly, only convert other modes
+                if img.mode in ("RGB", "RGBA"):
+                    src = img
+                else:
+                    # Palette/L images can carry alpha through tRNS instead of an A band
+                    has_alpha = "A" in img.getbands() or "transparency" in img.info
+                    src = img.convert("RGBA" if has_alpha else "RGB")
+                src.save(output_path, 'webp', lossless=False,
+                         quality=quality, method=webp_method,
+                         exif=img_exif)
+                # Free the converted copy right away, it can be as large as the source
+                if src is not img:
+                    src.close()
+                del src
+                return output_path
+            except Exception as e:
+                raise Exception(f'Failed to convert {filename} with ComfyUI workflow: {e}')
+    except Exception as e:
+        raise Exception(f'Failed to convert {filename}: {e}')
+
 
 class ConversionWorker(QThread):
     progress = pyqtSignal(int)  # Signal to update progress
-    finished_signal = pyqtSignal(list, list)  # Signal when all conversions are done
-    error_signal = pyqtSignal(str)  # Signal for errors
+    finished_signal = pyqtSignal(list, list, list, list, list)  # Signal when all conversions are done
+    error_signal = pyqtSignal(str)  # Signal for errors that abort the whole batch
 
-    def __init__(self, file_paths, output_dir, quality, keep_workflow, use_same_folder):
+    def __init__(self, file_paths, output_dir, quality, keep_workflow, use_same_folder, cpu_count,
+                 webp_method, skip_existing, stage_locally):
         super().__init__()
         self.file_paths = file_paths
         self.output_dir = output_dir
         self.quality = quality
         self.keep_workflow = keep_workflow
         self.use_same_folder = use_same_folder
-        self.cpu_count = multiprocessing.cpu_count()
+        self.cpu_count = cpu_count
+        self.webp_method = webp_method
+        self.skip_existing = skip_existing
+        self.stage_locally = stage_locally
 
     def run(self):
         try:
             if self.keep_workflow:
-                renamed_files, success = self.convert_images_to_webp_with_metadata()
+                renamed_files, success, skipped, overwritten, errors = \
+                    self.convert_images_to_webp_with_metadata()
             else:
-                renamed_files, success = self.convert_images_to_webp()
+                renamed_files, success, skipped, overwritten, errors = self.convert_images_to_webp()
             
-            self.finished_signal.emit(renamed_files, success)
+            self.finished_signal.emit(renamed_files, success, skipped, overwritten, errors)
         except Exception as e:
             self.error_signal.emit(str(e))
 
-    def convert_images_to_webp(self):
+    def resolve_output_paths(self):
+        # Pick every output name here, before dispatching, so that worker
+        # processes never race each other for the same file name
         renamed_files = []
-        success = []
-
-        def convert_single_image(img_path):
-            try:
-                img = Image.open(img_path)
-                filename = os.path.basename(img_path)
-                
-                # Determine output directory
-                if self.use_same_folder:
-                    output_dir = os.path.dirname(img_path)
-                else:
-                    output_dir = self.output_dir
-                
-                output_filename = os.path.splitext(filename)[0] + '.webp'
-                output_path = os.path.join(output_dir, output_filename)
-
-                # Create directory if it doesn't exist
+        jobs = []
+        skipped = []
+        # Stale outputs from an earlier run that skip mode re-encodes in place
+        stale_outputs = set()
+        # File names taken in each output directory, listed once per directory
+        claimed = {}
+        # File names picked by earlier images of this batch, per output directory
+        batch_claimed = {}
+
+        for img_path in self.file_paths:
+            dir_name, filename = os.path.split(img_path)
+            base_name = os.path.splitext(filename)[0]
+
+            # Determine output directory
+            output_dir = dir_name if self.use_same_folder else self.output_dir
+
+            output_filename = base_name + '.webp'
+            output_path = os.path.join(output_dir, output_filename)
+
+            if output_dir not in claimed:
+                # Create directory if it doesn't exist, once per output directory
                 os.makedirs(output_dir, exist_ok=True)
+                # Case-fold unconditionally, normcase is a no-op on POSIX but macOS volumes
+                # are usually case-insensitive. On case-sensitive ones this only adds renames
+                claimed[output_dir] = {name.casefold() for name in os.listdir(output_dir)}
+                batch_claimed[output_dir] = set()
+            taken = claimed[output_dir]
+            taken_in_batch = batch_claimed[output_dir]
+
+            # Check if file already exists (on disk or earlier in this batch). In skip mode
+            # an output left on disk by an earlier run is this image's previous result:
+            # skip it when up to date, otherwise re-encode over it instead of renaming
+            reuse_existing = False
+            counter = 1
+            while output_filename.casefold() in taken:
+                if self.skip_existing and output_filename.casefold() not in taken_in_batch:
+                    reuse_existing = True
+                    break
+                # Find a new name by appending a number if it already exists
+                output_filename = f"{base_name}_{counter}.webp"
+                counter += 1
+            output_path = os.path.join(output_dir, output_filename)
+
+            if reuse_existing and self.is_up_to_date(img_path, output_path):
+                skipped.append(img_path)
+                # Keep later inputs with the same base name from overwriting it
+                taken_in_batch.add(output_filename.casefold())
+                continue
+
+            if reuse_existing:
+                stale_outputs.add(output_path)
+
+            if counter > 1:
+                # Keep track of renamed files
+                renamed_files.append(f"{filename} -> {output_filename}")
+
+            taken.add(output_filename.casefold())
+            taken_in_batch.add(output_filename.casefold())
+            jobs.append((img_path, output_path))
+
+        return renamed_files, jobs, skipped, stale_outputs
+
+    @staticmethod
+    def is_up_to_date(img_path, output_path):
+        # Only stat'ed for names already on disk, so re-runs cost one stat per existing output
+        try:
+            return os.stat(output_path).st_mtime > os.stat(img_path).st_mtime
+        except OSError:
+            # e.g. only a differently-cased name exists on a case-sensitive filesystem
+            return False
 
-                # Check if file already exists
-                if os.path.exists(output_path):
-                    base_name = os.path.splitext(output_filename)[0]
-                    counter = 1
-                    # Find a new name by appending a number if it already exists
-                    while os.path.exists(output_path):
-                        output_filename = f"{base_name}_{counter}.webp"
-                        output_path = os.path.join(output_dir, output_filename)
-                        counter += 1
-
-                    # Keep track of renamed files
-                    renamed_files.append(f"{filename} -> {output_filename}")
-
-                # Save the image as WebP
-                img.save(output_path, 'webp', quality=self.quality)
-                return output_path
-            except Exception as e:
-                raise Exception(f'Failed to convert {filename}: {e}')
-
-        # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=self.cpu_count) as executor:
-            futures = [executor.submit(convert_single_image, img_path) for img_path in self.file_paths]
-            
-            for i, future in enumerate(futures):
+    def convert_images(self, convert_func):
+        success = []
+        # (img_path, error message) per failed image, reported once at the end
+        errors = []
+        renamed_files, jobs, skipped, stale_outputs = self.resolve_output_paths()
+        total = len(jobs)
+
+        # Bound read-ahead and queued work to a couple of images per worker
+        max_inflight = 2 * self.cpu_count
+        prefetched = queue.Queue(maxsize=max_inflight)
+
+        def reader():
+            # Warm the page cache for upcoming files while workers encode
+            for img_path, output_path in jobs:
                 try:
-                    result = future.result()
-                    success.append(result)
-                    self.progress.emit(int((i + 1) / len(futures) * 100))
-                except Exception as e:
-                    self.error_signal.emit(str(e))
+                    prefetch_file(img_path)
+                except Exception:
+                    # The worker reports the error when it opens the file, every job
+                    # must still reach the queue or convert_images would wait forever
+                    pass
+                prefetched.put((img_path, output_path))
+
+        threading.Thread(target=reader, daemon=True).start()
+
+        # Keep native libraries single-threaded inside each worker process,
+        # parallelism comes from the pool itself (workers inherit this)
+        os.environ['OMP_NUM_THREADS'] = '1'
+
+        # Use ProcessPoolExecutor so encoding is not serialized on the GIL.
+        # QThreadPool would run tasks on threads and hit the same GIL limit.
+        # Progress is counted as futures complete, not in submission order
+        pool_kwargs = {}
+        if sys.version_info >= (3, 11):
+            # Recycle workers periodically so long batches don't grow their memory
+            pool_kwargs['max_tasks_per_child'] = 50
+
+        # Encode into a local temp dir and move outputs into place in the background,
+        # writing straight to a network share is much slower than a local write + move
+        staging_dir = tempfile.mkdtemp(prefix='webp-converter-') if self.stage_locally else None
+        moves = {}  # move future -> (img_path, output_path)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as mover, \
+                    ProcessPoolExecutor(max_workers=self.cpu_count, **pool_kwargs) as executor:
+                pending = {}  # future -> (img_path, output_path)
+                submitted = 0
+                i = 0
+                # Only emit when the percentage changes to avoid flooding the UI thread
+                last_pct = -1
+                while i < total:
+                    # Feed prefetched files to the pool, only block when it is idle
+                    while submitted < total and len(pending) < max_inflight:
+                        try:
+                            img_path, output_path = prefetched.get(block=not pending)
+                        except queue.Empty:
+                            break
+                        if staging_dir:
+                            target_path = os.path.join(staging_dir, f'{submitted}.webp')
+                        else:
+                            target_path = output_path
+                        future = executor.submit(convert_func, img_path, target_path,
+                                                 self.quality, self.webp_method)
+                        pending[future] = (img_path, output_path)
+                        submitted += 1
+
+                    done, _ = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        img_path, output_path = pending.pop(future)
+                        try:
+                            result = future.result()
+                            if staging_dir:
+                                moves[mover.submit(shutil.move, result, output_path)] = (img_path, output_path)
+                            else:
+                                success.append(result)
+                        except Exception as e:
+                            errors.append((img_path, str(e)))
+                        i += 1
 
-        return renamed_files, success
+                    pct = i * 100 // total
+                    if pct != last_pct:
+                        self.progress.emit(pct)
+                        last_pct = pct
 
-    def convert_images_to_webp_with_metadata(self):
-        renamed_files = []
-        success = []
+            # Both executors are shut down here, so every move has finished
+            for future, (img_path, output_path) in moves.items():
+                try:
+                    future.result()
+                    success.append(output_path)
+                except Exception as e:
+                    errors.append((img_path, f'Failed to move {os.path.basename(output_path)}: {e}'))
+        finally:
+            if staging_dir:
+                shutil.rmtree(staging_dir, ignore_errors=True)
 
-        def convert_single_image_with_metadata(img_path):
-            try:
-                img = Image.open(img_path)
-                filename = os.path.basename(img_path)
-                
-                # Determine output directory
-                if self.use_same_folder:
-                    output_dir = os.path.dirname(img_path)
-                else:
-                    output_dir = self.output_dir
-                
-                output_filename = os.path.splitext(filename)[0] + '.webp'
-                output_path = os.path.join(output_dir, output_filename)
+        overwritten = [path for path in success if path in stale_outputs]
+        return renamed_files, success, skipped, overwritten, errors
 
-                # Create directory if it doesn't exist
-                os.makedirs(output_dir, exist_ok=True)
+    def convert_images_to_webp(self):
+        return self.convert_images(convert_single_image)
 
-                # Check if file already exists
-                if os.path.exists(output_path):
-                    base_name = os.path.splitext(output_filename)[0]
-                    counter = 1
-                    # Find a new name by appending a number if it already exists
-                    while os.path.exists(output_path):
-                        output_filename = f"{base_name}_{counter}.webp"
-                        output_path = os.path.join(output_dir, output_filename)
-                        counter += 1
+    def convert_images_to_webp_with_metadata(self):
+        return self.convert_images(convert_single_image_with_metadata)
 
-                    # Keep track of renamed files
-                    renamed_files.append(f"{filename} -> {output_filename}")
 
-                # Saving
-                if filename.lower().endswith(".png"):
-                    # get info
-                    try:
-                        dict_of_info = img.info.copy()
-                        # Remove nodes that may cause problems
-                        try:
-                            c = json.loads(dict_of_info.get("workflow"))
-                            nodes: list = c.get('nodes')
-                            for n in nodes:
-                                if n['type'] == 'LoraInfo':
-                                    nodes.remove(n)
-                            dict_of_info['workflow'] = json.dumps(c)
-                        except Exception as e:
-                            print(e)
-                            pass
-
-                        # Saving
-                        img_exif = img.getexif()
-                        user_comment = dict_of_info.get("workflow", "")
-                        img_exif[0x010e] = "Workflow:" + user_comment
-                        img.convert("RGB").save(output_path, lossless=False,
-                                                quality=self.quality, webp_method=6,
-                                                exif=img_exif)
-                        return output_path
-                    except Exception as e:
-                        raise Exception(f'Failed to convert {filename} with ComfyUI workflow: {e}')
-                else:
-                    raise Exception(f'Failed to convert {filename} with ComfyUI workflow.\n'
-                                   f'Consider using png files with workflow or uncheck keep ComfyUI workflow')
-            except Exception as e:
-                raise Exception(f'Failed to convert {filename}: {e}')
+class FolderScanWorker(QThread):
+    finished_signal = pyqtSignal(list)  # Signal with the image paths found
 
-        # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=self.cpu_count) as executor:
-            futures = [executor.submit(convert_single_image_with_metadata, img_path) for img_path in self.file_paths]
-            
-            for i, future in enumerate(futures):
-                try:
-                    result = future.result()
-                    success.append(result)
-                    self.progress.emit(int((i + 1) / len(futures) * 100))
-                except Exception as e:
-                    self.error_signal.emit(str(e))
+    def __init__(self, folder):
+        super().__init__()
+        self.folder = folder
 
-        return renamed_files, success
+    def run(self):
+        self.finished_signal.emit(list(iter_image_files(self.folder)))
 
 
 class ImageConverter(QWidget):
@@ -190,6 +425,14 @@ class ImageConverter(QWidget):
         self.same_folder_checkbox.stateChanged.connect(self.toggle_output_selection)
         layout.addWidget(self.same_folder_checkbox)
 
+        # Add check box for skipping images that were already converted
+        self.skip_existing_checkbox = QCheckBox('Skip files whose .webp already exists (re-encodes stale .webp in place)', self)
+        layout.addWidget(self.skip_existing_checkbox)
+
+        # Add check box for encoding locally first, useful for network shares
+        self.stage_checkbox = QCheckBox('Stage writes via local temp (faster on network shares)', self)
+        layout.addWidget(self.stage_checkbox)
+
         # Label for file selection
         self.file_label = QLabel('Select Images to Convert:', self)
         layout.addWidget(self.file_label)
@@ -215,13 +458,22 @@ class ImageConverter(QWidget):
 
         # CPU count selection
         cpu_layout = QHBoxLayout()
-        cpu_layout.addWidget(QLabel('Number of threads:'))
+        cpu_layout.addWidget(QLabel('Number of worker processes:'))
         self.cpu_spinbox = QSpinBox()
         self.cpu_spinbox.setRange(1, multiprocessing.cpu_count())
         self.cpu_spinbox.setValue(multiprocessing.cpu_count())
         cpu_layout.addWidget(self.cpu_spinbox)
         layout.addLayout(cpu_layout)
 
+        # WebP encoder effort selection (higher is slower but smaller)
+        method_layout = QHBoxLayout()
+        method_layout.addWidget(QLabel('WebP effort (0-6):'))
+        self.method_spinbox = QSpinBox()
+        self.method_spinbox.setRange(0, 6)
+        self.method_spinbox.setValue(4)  # libwebp default
+        method_layout.addWidget(self.method_spinbox)
+        layout.addLayout(method_layout)
+
         # Input for quality selection
         self.quality_label = QLabel('Enter WebP Quality (1-100): 87', self)
         layout.addWidget(self.quality_label)
@@ -247,6 +499,7 @@ class ImageConverter(QWidget):
         self.file_paths = []
         self.output_dir = ""
         self.worker = None
+        self.scanner = None
 
     def toggle_output_selection(self, state):
         # Enable/disable output directory selection based on checkbox
@@ -271,13 +524,25 @@ class ImageConverter(QWidget):
         folder = QFileDialog.getExistingDirectory(self, 'Select Folder to Convert')
         if folder:
             self.file_paths = []
-            # Walk through directory and subdirectories
-            for root, dirs, files in os.walk(folder):
-                for file in files:
-                    if file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.tiff')):
-                        self.file_paths.append(os.path.join(root, file))
-            
-            self.file_label.setText(f'Selected {len(self.file_paths)} image(s) from folder and subfolders')
+            self.file_label.setText('Scanning folder...')
+            # Don't allow converting or another selection until this scan is done
+            self.convert_button.setEnabled(False)
+            self.file_button.setEnabled(False)
+            self.folder_button.setEnabled(False)
+
+            # Walk through directory and subdirectories off the UI thread
+            self.scanner = FolderScanWorker(folder)
+            self.scanner.finished_signal.connect(self.folder_scanned)
+            self.scanner.start()
+
+    def folder_scanned(self, file_paths):
+        self.file_paths = file_paths
+        self.file_label.setText(f'Selected {len(self.file_paths)} image(s) from folder and subfolders')
+        # Never re-enable converting while a conversion is still running
+        if self.worker is None or not self.worker.isRunning():
+            self.convert_button.setEnabled(True)
+            self.file_button.setEnabled(True)
+            self.folder_button.setEnabled(True)
 
     def select_output_directory(self):
         self.output_dir = QFileDialog.getExistingDirectory(self, 'Select Output Directory')
@@ -302,8 +567,10 @@ class ImageConverter(QWidget):
             QMessageBox.warning(self, 'Error', 'Please select an output directory.')
             return
 
-        # Disable convert button while converting
+        # Disable convert and browse buttons while converting
         self.convert_button.setEnabled(False)
+        self.file_button.setEnabled(False)
+        self.folder_button.setEnabled(False)
         self.progress_label.setText('Converting...')
 
         # Create worker thread
@@ -313,7 +580,11 @@ class ImageConverter(QWidget):
             self.output_dir, 
             quality, 
             self.checkbox.isChecked(),
-            use_same_folder
+            use_same_folder,
+            self.cpu_spinbox.value(),
+            self.method_spinbox.value(),
+            self.skip_existing_checkbox.isChecked(),
+            self.stage_checkbox.isChecked()
         )
         
         self.worker.progress.connect(self.update_progress)
@@ -324,23 +595,37 @@ class ImageConverter(QWidget):
     def update_progress(self, value):
         self.progress_label.setText(f'Converting... {value}%')
 
-    def conversion_finished(self, renamed_files, success):
+    def conversion_finished(self, renamed_files, success, skipped, overwritten, errors):
         # Prepare the message to show to the user
+        summary = f'Converted {len(success)} image(s).'
+        if skipped:
+            summary += f'\nSkipped {len(skipped)} image(s) with an up-to-date .webp.'
+        if errors:
+            summary += f'\nFailed to convert {len(errors)} image(s), see details.'
+        if overwritten:
+            overwritten_message = "\n".join(overwritten)
+            summary += (f'\nThe following outputs were older than their source and '
+                        f'have been re-encoded in place:\n{overwritten_message}')
         if renamed_files:
             renamed_files_message = "\n".join(renamed_files)
-            QMessageBox.information(self, 'Process Completed',
-                                    f'Converted {len(success)} image(s).\nThe output directory contained files '
-                                    f'with identical names. \nThe following converted files have been renamed:\n'
-                                    f'{renamed_files_message}')
-        else:
-            QMessageBox.information(self, 'Process Completed',
-                                    f'Converted {len(success)} image(s).')
+            summary += (f'\nThe output directory contained files '
+                        f'with identical names. \nThe following converted files have been renamed:\n'
+                        f'{renamed_files_message}')
+
+        # One dialog for the whole batch, failures go in the scrollable details
+        message_box = QMessageBox(QMessageBox.Warning if errors else QMessageBox.Information,
+                                  'Process Completed', summary, parent=self)
+        if errors:
+            message_box.setDetailedText("\n".join(f'{path}: {error}' for path, error in errors))
+        message_box.exec_()
 
         # Reset the label
         self.file_label.setText('Select Images to Convert:')
         self.progress_label.setText('')
-        # Reset convert button
+        # Reset convert and browse buttons
         self.convert_button.setEnabled(True)
+        self.file_button.setEnabled(True)
+        self.folder_button.setEnabled(True)
         
         # Clear file paths
         self.file_paths = []
@@ -349,9 +634,13 @@ class ImageConverter(QWidget):
         QMessageBox.warning(self, 'Error', f'Conversion failed: {error_message}')
         self.progress_label.setText('')
         self.convert_button.setEnabled(True)
+        self.file_button.setEnabled(True)
+        self.folder_button.setEnabled(True)
 
 
 if __name__ == '__main__':
+    # Required for worker processes in frozen Windows builds
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = ImageConverter()
     window.show()